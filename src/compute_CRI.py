@@ -1,9 +1,9 @@
 import os
-import pandas as pd
+import polars as pl
 from pathlib import Path
 
 # Will compute the final CRI score
-# Will apply equal weights (1/3) to each of the three metrics:  
+# Will apply equal weights (1/3) to each of the three metrics:
 #   - Food Insecurity Score (FIS)
 #   - Healthcare Uninsured Count
 #   - Socioeconomic Vulnerability (SEV)
@@ -13,76 +13,66 @@ from pathlib import Path
 # If case studies/research show one metric is more important, we can adjust the weights later
 
 data_directory =  Path('data')
-socioeconomic_sev = data_directory / 'socioeconomic_sev.csv'
+socioeconomic_sev = data_directory / 'socioeconomic_sev.parquet'
 healthcare_sev = data_directory / 'healthcare_resilience.csv'
-food_access_score = data_directory / 'food_access_score.csv'
+food_access_score = data_directory / 'food_access_score.parquet'
 OUTPUT_CSV = data_directory / 'community_resilience_index.csv'
 
-# Load & rename FIPS columns
-socio_df = pd.read_csv(socioeconomic_sev, dtype=str)
-# Rename uppercase 'State' → 'state'
-socio_df = socio_df.rename(columns={'State': 'state'})
-food_df  = pd.read_csv(food_access_score, dtype=str)
-# Rename uppercase 'State' → 'state'
-food_df  = food_df.rename(columns={'State': 'state'})
-health_df= pd.read_csv(healthcare_sev, dtype=str)
-# Rename StateFIPS/CountyFIPS → state/county
-health_df = health_df.rename(columns={
-    'StateFIPS': 'state',
-    'CountyFIPS': 'county'
-})
-
 # Zero-pad FIPS strings
-for dataframe in (socio_df, food_df, health_df):
-    dataframe['state']  = dataframe['state'].str.zfill(2)
-    dataframe['county'] = dataframe['county'].str.zfill(3)
+def pad_fips(frame):
+    return frame.with_columns(
+        pl.col('state').str.zfill(2),
+        pl.col('county').str.zfill(3),
+    )
 
-# Merge three components on (state, county)
-merged_file = (
-    socio_df
-    .merge(food_df[['state','county','Resilience_Food']], on=['state','county'], how='left')
-    .merge(health_df[['state','county','Resilience_Health']], on=['state','county'], how='left')
+# Lazily scan & rename FIPS columns (FIPS are strings so leading zeros survive; the Parquet files already store them that way)
+socio_df = pad_fips(
+    pl.scan_parquet(socioeconomic_sev)
+    # Rename uppercase 'State' → 'state'
+    .rename({'State': 'state'})
+)
+food_df = pad_fips(
+    pl.scan_parquet(food_access_score)
+    # Rename uppercase 'State' → 'state'
+    .rename({'State': 'state'})
+)
+health_df = pad_fips(
+    pl.scan_csv(healthcare_sev, schema_overrides={'StateFIPS': pl.Utf8, 'CountyFIPS': pl.Utf8})
+    # Rename StateFIPS/CountyFIPS → state/county
+    .rename({'StateFIPS': 'state', 'CountyFIPS': 'county'})
 )
-
-# Convert all resilience columns to numeric
-for col in ['Resilience_Socio','Resilience_Food','Resilience_Health']:
-    merged_file[col] = pd.to_numeric(merged_file[col], errors='coerce')
 
 # Computes the CRI with equal weights
 w1 = w2 = w3 = 1/3
-merged_file['CRI'] = (
-    w1 * merged_file['Resilience_Socio'] +
-    w2 * merged_file['Resilience_Food'] +
-    w3 * merged_file['Resilience_Health']
-)
-
-merged_file['state_name']  = 'Georgia'
 
-# Only keeps the relevant variables for the CRI
-output = merged_file[[
-    'state',        
-    'state_name',    
-    'county',        
-    'County Name',   
-    'Resilience_Socio',
-    'Resilience_Food',
-    'Resilience_Health',
-    'CRI'
-]]
+# Merge three components on (state, county), compute the CRI, and collect the whole lazy pipeline at once
+merged_file = (
+    socio_df
+    .join(food_df.select(['state','county','Resilience_Food']), on=['state','county'], how='left')
+    .join(health_df.select(['state','county','Resilience_Health']), on=['state','county'], how='left')
+    .with_columns(
+        CRI=(
+            w1 * pl.col('Resilience_Socio') +
+            w2 * pl.col('Resilience_Food') +
+            w3 * pl.col('Resilience_Health')
+        ),
+        state_name=pl.lit('Georgia'),
+    )
+)
 
-# Renames the columns to be more descriptive
-output.columns = [
-    'StateFIPS',
-    'State Name',
-    'CountyFIPS',
-    'County Name',
-    'Socioeconomic Resilience',
-    'Food Resilience',
-    'Healthcare Resilience',
-    'Community Resilience Index (CRI)'
-]
+# Only keeps the relevant variables for the CRI and renames the columns to be more descriptive
+output = merged_file.select(
+    pl.col('state').alias('StateFIPS'),
+    pl.col('state_name').alias('State Name'),
+    pl.col('county').alias('CountyFIPS'),
+    pl.col('County Name'),
+    pl.col('Resilience_Socio').alias('Socioeconomic Resilience'),
+    pl.col('Resilience_Food').alias('Food Resilience'),
+    pl.col('Resilience_Health').alias('Healthcare Resilience'),
+    pl.col('CRI').alias('Community Resilience Index (CRI)'),
+).collect()
 
 # 8) Save that
 os.makedirs(data_directory, exist_ok=True)
-output.to_csv(OUTPUT_CSV, index=False)
+output.write_csv(OUTPUT_CSV)
 print(f"Saved final CRI to {OUTPUT_CSV}")
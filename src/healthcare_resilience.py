@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 
 # --------------------
@@ -22,21 +23,20 @@ OUTPUT_CSV = 'data/healthcare_resilience.csv'
 # 2) Load data
 df = pd.read_csv(INPUT_CSV)
 
-# 3) Compute uninsured rate
-df['uninsured_rate'] = df['Uninsured Population Under 65'] / df['Total Population Under 65']
+# 3) Compute uninsured rate and normalize it via min-max in one NumPy pass
+#    A county with no population under 65 gives 0/0 = NaN, so (like the pandas reductions) min/max skip NaN
+with np.errstate(divide='ignore', invalid='ignore'):
+    rate = df['Uninsured Population Under 65'].to_numpy() / df['Total Population Under 65'].to_numpy()
+minimum_val, maximum_val = np.nanmin(rate), np.nanmax(rate)
+span = maximum_val - minimum_val
+normalized = (rate - minimum_val) / span if span > 0 else rate
 
-# 4) Normalize uninsured_rate via min-max
-minimum_val = df['uninsured_rate'].min()
-maximum_val = df['uninsured_rate'].max()
-if maximum_val > minimum_val:
-    df['Normalized_Uninsured'] = (df['uninsured_rate'] - minimum_val) / (maximum_val - minimum_val)
-else:
-    df['Normalized_Uninsured'] = df['uninsured_rate']
+# 4) Write the rate, normalized rate, and derived resilience together
+df['uninsured_rate'] = rate
+df['Normalized_Uninsured'] = normalized
+df['Resilience_Health'] = 1.0 - normalized
 
-# 5) Derive resilience
-df['Resilience_Health'] = 1 - df['Normalized_Uninsured']
-
-# 6) Save results
+# 5) Save results
 os.makedirs('data', exist_ok=True)
 df.to_csv(OUTPUT_CSV, index=False)
 print(f"✅ Saved healthcare resilience data to {OUTPUT_CSV}")
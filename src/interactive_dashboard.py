@@ -1,16 +1,15 @@
 import re
 import os
-import json
+import orjson
 import math
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from pathlib import Path
-from shapely.geometry import shape
-import feedparser
 import urllib.parse
 import requests
-from sklearn.cluster import KMeans
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import xml.etree.ElementTree as ET
 import numpy as np
 
 
@@ -25,44 +24,119 @@ DATA_DIR = HERE / "data"
 CRI_CSV = DATA_DIR / "community_resilience_index.csv"
 GEOJSON = DATA_DIR / "counties.geojson"
 
+# CRI range pattern for the chat bot: one compiled alternation, so a question is scanned once
+_CRI_RE = re.compile(
+    r"between\s*(?P<low>[0-9]*\.?[0-9]+)\s*(?:and|to)\s*(?P<high>[0-9]*\.?[0-9]+)"
+    r"|above\s*(?P<above>[0-9]*\.?[0-9]+)"
+    r"|below\s*(?P<below>[0-9]*\.?[0-9]+)"
+)
+
 
 #
 # ─── LOAD & PREP DATA ────────────────────────────────────────────────────────────
 #
-@st.cache_data
-def load_data():
-    dataframe = pd.read_csv(CRI_CSV, dtype=str)
+
+# Shoelace centroids (lat, lon arrays) of the largest outer ring of each Polygon/MultiPolygon feature
+def _centroids(features):
+    rings, ring_feature = [], []
+    for i, feat in enumerate(features):
+        geometry = feat["geometry"]
+        polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+        for polygon in polygons:
+            rings.append(np.asarray(polygon[0], dtype=np.float64)[:, :2])
+            ring_feature.append(i)
+    ring_feature = np.array(ring_feature)
+    starts = np.cumsum([0] + [len(ring) for ring in rings[:-1]])
+
+    coords = np.concatenate(rings)
+    x, y = coords[:, 0], coords[:, 1]
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    # Zero out the segments that join the end of one ring to the start of the next
+    cross[starts[1:] - 1] = 0.0
+    area = 0.5 * np.add.reduceat(cross, starts)
+    cx = np.add.reduceat((x[:-1] + x[1:]) * cross, starts) / (6 * area)
+    cy = np.add.reduceat((y[:-1] + y[1:]) * cross, starts) / (6 * area)
+
+    # Largest ring per feature: sort by (feature, |area|) and keep the last ring of each feature
+    order = np.lexsort((np.abs(area), ring_feature))
+    best = order[np.r_[ring_feature[order][1:] != ring_feature[order][:-1], True]]
+    # Summed in float64, stored as float32
+    return cy[best].astype(np.float32), cx[best].astype(np.float32)
+
+# Load the Georgia county GeoJSON and its centroids once, shared across sessions
+@st.cache_resource
+def load_geojson():
+    gj = orjson.loads(GEOJSON.read_bytes())
+
+    # Keep only Georgia counties (state FIPS '13')
+    gj["features"] = [feat for feat in gj["features"] if feat["properties"]["GEOID"].startswith("13")]
+
+    # Compute centroids for the counties
+    fips_list = [feat["properties"]["GEOID"] for feat in gj["features"]]
+    lat_arr, lon_arr = _centroids(gj["features"])
+
+    # Round the coordinates sent to Plotly to 4 decimals (~11 m)
+    for feat in gj["features"]:
+        geometry = feat["geometry"]
+        polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+        polygons = [[np.round(ring, 4).tolist() for ring in polygon] for polygon in polygons]
+        geometry["coordinates"] = polygons if geometry["type"] == "MultiPolygon" else polygons[0]
+
+    # Returns the GeoJSON, the FIPS codes, and the centroid arrays
+    return gj, fips_list, lat_arr, lon_arr
+
+# Load the CRI CSV (persisted to disk, keyed on the CSV's mtime and the GeoJSON FIPS order)
+@st.cache_data(persist="disk")
+def load_csv(csv_mtime_ns, fips_list):
+    # Parse FIPS as strings, county names as categories, and the scores straight to float32 in one pass
+    score_columns = [
+        "Socioeconomic Resilience",
+        "Food Resilience",
+        "Healthcare Resilience",
+        "Community Resilience Index (CRI)"
+    ]
+    # Only the columns the dashboard uses are materialized
+    dtype_map = {"StateFIPS": str, "CountyFIPS": str, "County Name": "category"}
+    dtype_map.update({column: np.float32 for column in score_columns})
+    dataframe = pd.read_csv(CRI_CSV, usecols=list(dtype_map), dtype=dtype_map)
 
     # Build FIPS
     dataframe["state"]  = dataframe["StateFIPS"].str.zfill(2)
     dataframe["county"] = dataframe["CountyFIPS"].str.zfill(3)
     dataframe["fips"]   = dataframe["state"] + dataframe["county"]
+    dataframe["fips_int"] = dataframe["state"].astype(np.int32) * 1000 + dataframe["county"].astype(np.int32)
 
-    # Numeric columns
-    for column in [
-        "Socioeconomic Resilience",
-        "Food Resilience",
-        "Healthcare Resilience",
-        "Community Resilience Index (CRI)"
-    ]:
-        dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce").round(4)
+    # Round the numeric columns
+    dataframe[score_columns] = dataframe[score_columns].round(4)
 
     # Keep only Georgia (state FIPS == '13')
     dataframe = dataframe[dataframe["state"] == "13"].copy()
 
-    # Load geojson & compute centroids for the counties
-    gj = json.loads((GEOJSON).read_text())
-    cents = {}
-    for feat in gj["features"]:
-        geoid = feat["properties"]["GEOID"]
-        cent  = shape(feat["geometry"]).centroid
-        cents[geoid] = (cent.y, cent.x)
+    # Dictionary-encode the FIPS parts and drop county names that only appeared outside Georgia
+    for column in ["state", "county"]:
+        dataframe[column] = dataframe[column].astype("category")
+    dataframe["County Name"] = dataframe["County Name"].cat.remove_unused_categories()
+    county_options = tuple(sorted(dataframe["County Name"].cat.categories))
+
+    # FIPS as a categorical over the GeoJSON feature order (category code = centroid index)
+    dataframe["fips"] = dataframe["fips"].astype(pd.CategoricalDtype(categories=list(fips_list)))
 
-    # Returns the DataFrame, the GeoJSON, and the centroids
-    return dataframe, gj, cents
+    # CRI bounds for the slider, computed once here instead of on every rerun
+    cri_min = float(dataframe["Community Resilience Index (CRI)"].min())
+    cri_max = float(dataframe["Community Resilience Index (CRI)"].max())
+
+    # Copy of the counties sorted by CRI (ascending) for binary-search range queries
+    cri_sorted_df = dataframe.sort_values("Community Resilience Index (CRI)", kind="stable")
+    cri_sorted_vals = cri_sorted_df["Community Resilience Index (CRI)"].to_numpy()
+
+    # Returns the DataFrame, the selectbox county options, the CRI bounds, and the CRI-sorted copy
+    return dataframe, county_options, cri_min, cri_max, cri_sorted_df, cri_sorted_vals
 
 # Load the data
-cri_df, counties_geojson, centroids = load_data()
+counties_geojson, fips_list, lat_arr, lon_arr = load_geojson()
+cri_df, county_options, cri_min, cri_max, cri_sorted_df, cri_sorted_vals = load_csv(
+    CRI_CSV.stat().st_mtime_ns, tuple(fips_list)
+)
 
 
 
@@ -80,62 +154,205 @@ def haversine(a, b):
         * math.cos(math.radians(latitude2)) * math.sin(dist_lon/2)**2
     return 3958.8 * 2 * math.asin(math.sqrt(hsine))
 
-# Filter the CRI DataFrame based on a range
+# Vectorized Haversine: distance from one lat/lon point to arrays of lat/lon points in a single NumPy pass
+def haversine_vec(center_lat, center_lon, lats, lons):
+    dist_lat = np.radians(lats - center_lat)
+    dist_lon = np.radians(lons - center_lon)
+    hsine = np.sin(dist_lat/2)**2 + np.cos(np.radians(center_lat)) \
+        * np.cos(np.radians(lats)) * np.sin(dist_lon/2)**2
+    return 3958.8 * 2 * np.arcsin(np.sqrt(hsine))
+
+# County-to-county distance matrix (miles, float32) in one broadcast haversine_vec call
+@st.cache_data(persist="disk")
+def compute_dist_matrix(lats, lons):
+    return haversine_vec(lats[:, None], lons[:, None], lats[None, :], lons[None, :]).astype(np.float32)
+
+# Distance matrix rows/columns follow cri_df row order
+fips_codes = cri_df["fips"].cat.codes.to_numpy()
+dist_matrix = compute_dist_matrix(lat_arr[fips_codes], lon_arr[fips_codes])
+
+# Filter the CRI DataFrame based on a range (highest CRI first)
 def cri_range(low, high):
-    sub = cri_df[(cri_df["Community Resilience Index (CRI)"] >= low) & (cri_df["Community Resilience Index (CRI)"] <= high)]
-    return sub.sort_values("Community Resilience Index (CRI)", ascending=False)
+    # Cast the bounds to the column dtype so boundary values compare like a pandas mask
+    as_col = cri_sorted_vals.dtype.type
+    lo_idx = np.searchsorted(cri_sorted_vals, as_col(low), side="left")
+    hi_idx = np.searchsorted(cri_sorted_vals, as_col(high), side="right")
+    return cri_sorted_df.iloc[lo_idx:hi_idx][::-1]
 
 # Parse the CRI range based on the user input in the chat bot
 def parse_cri_range(text: str):
-    txt = text.lower()
-    # between X and Y
-    mid = re.search(r"between\s*([0-9]*\.?[0-9]+)\s*(?:and|to)\s*([0-9]*\.?[0-9]+)", txt)
-    if mid:
-        return float(mid.group(1)), float(mid.group(2))
-    # above X
-    mid = re.search(r"above\s*([0-9]*\.?[0-9]+)", txt)
+    mid = _CRI_RE.search(text.lower())
     if mid:
-        return float(mid.group(1)), 1.0
-    # below X
-    mid = re.search(r"below\s*([0-9]*\.?[0-9]+)", txt)
-    if mid:
-        return 0.0, float(mid.group(1))
+        # between X and Y
+        if mid["low"] is not None:
+            return float(mid["low"]), float(mid["high"])
+        # above X
+        if mid["above"] is not None:
+            return float(mid["above"]), 1.0
+        # below X
+        return 0.0, float(mid["below"])
     raise ValueError("Sorry, I couldn't parse a CRI range from that question. " \
     "Please format your question in the example given above and try again.")
 
+# Pooled HTTP session shared across reruns, retrying 429/503 responses
+@st.cache_resource
+def http_session():
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 503])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    return session
+
+# ETag / Last-Modified and last result of the NOAA request
+@st.cache_resource
+def noaa_state():
+    return {}
+
 # Fetch the NOAA weather warnings for counties in Georgia that have an active warning
 @st.cache_data(ttl=300)
 def fetch_noaa_warnings():
     noaa_url = "https://api.weather.gov/alerts/active?area=GA"
-    req = requests.get(noaa_url, timeout=10)
+    state = noaa_state()
+    # Conditional GET with the validators from the last response
+    headers = {}
+    if "fips" in state:
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+    req = http_session().get(noaa_url, headers=headers, timeout=10)
+    if req.status_code == 304 and "fips" in state:
+        return state["fips"]
     req.raise_for_status()
     noaa_data = req.json()
-    warning_fips = set()
-    for feat in noaa_data["features"]:
-        geocode = feat["properties"].get("geocode",{}) or {}
-        for code in geocode.get("SAME", []):
-            # NWS SAME codes are 5-digit state+county FIPS (e.g. "13057")
-            if len(code) == 5 and code.startswith("13"):
-                warning_fips.add(code)
+    # NWS SAME codes are 5-digit state+county FIPS (e.g. "13057"); keep the Georgia ones as sorted int32
+    warning_fips = np.array(sorted({
+        int(code)
+        for feat in noaa_data["features"]
+        for code in (feat["properties"].get("geocode", {}) or {}).get("SAME", ())
+        if len(code) == 5 and code.startswith("13")
+    }), dtype=np.int32)
+    state.update(etag=req.headers.get("ETag"), last_modified=req.headers.get("Last-Modified"), fips=warning_fips)
     return warning_fips
 
-@st.cache_data
-def compute_res_clusters(df, n_clusters=4):
+# Fetch and parse the Google News RSS feed (title, link and publish date of each item), cached for 10 minutes
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def load_rss(url):
+    resp = http_session().get(url, timeout=5)
+    resp.raise_for_status()
+    root = ET.fromstring(resp.content)
+    return [
+        {
+            "title": item.findtext("title", ""),
+            "link": item.findtext("link", ""),
+            "published": item.findtext("pubDate", ""),
+        }
+        for item in root.iter("item")
+    ]
+
+# Fit the KMeans model once, shared across sessions
+@st.cache_resource
+def fit_res_clusters(df, n_clusters=4):
+    # Imported lazily to keep scikit-learn out of cold start
+    from sklearn.cluster import KMeans
+
     # Through scikit-learn's KMeans, we can cluster the counties based on their resilience scores.
     # We will use the four resilience scores as features for clustering.
     X = df[[
         "Socioeconomic Resilience",
         "Food Resilience",
         "Healthcare Resilience"
-    ]].to_numpy()
-    kmeans = KMeans(n_clusters=n_clusters, random_state=0)
-    labels = kmeans.fit_predict(X)
+    ]].to_numpy(dtype=np.float32)
+    # One k-means++ initialisation with Elkan's algorithm
+    kmeans = KMeans(n_clusters=n_clusters, n_init=1, random_state=0, algorithm="elkan")
+    kmeans.fit(X)
+    return kmeans
+
+# Cluster labels and centers, persisted to disk
+@st.cache_data(persist="disk")
+def compute_res_clusters(df, n_clusters=4):
+    kmeans = fit_res_clusters(df, n_clusters)
     df2 = df.copy()
-    df2["cluster"] = labels.astype(str)
-    return df2, kmeans
+    df2["cluster"] = kmeans.labels_.astype(str)
+    return df2, kmeans.cluster_centers_
 
 # Compute the clusters
-clustered_df, kmeans_model = compute_res_clusters(cri_df)
+clustered_df, cluster_centers = compute_res_clusters(cri_df)
+
+# Filter a base DataFrame by the CRI range and, when a county is selected, by radius around that county
+def filter_map(base, min_c, max_c, county, radius):
+    # Both CRI bounds in one query
+    df_map = base.query("`Community Resilience Index (CRI)` >= @min_c and `Community Resilience Index (CRI)` <= @max_c")
+    if county!="All":
+        center_pos = (cri_df["County Name"] == county).to_numpy().argmax()
+        dist = dist_matrix[center_pos, cri_df.index.get_indexer(df_map.index)]
+        df_map = df_map.assign(dist=dist).query("dist <= @radius")
+    return df_map
+
+# Build the choropleth for one combination of map toggle and filters
+@st.cache_data(max_entries=64)
+def build_fig(map_toggle, min_c, max_c, county, radius):
+    # Imported lazily to keep Plotly Express out of cold start
+    import plotly.express as px
+
+    # fips_int is carried as the last (hidden) customdata column for the NOAA overlay
+    hover_columns = [
+        "County Name",
+        "Socioeconomic Resilience",
+        "Food Resilience",
+        "Healthcare Resilience",
+    ]
+
+    # If the map toggle is resilience cluster
+    if map_toggle == "Resilience Clusters":
+        df_map = filter_map(clustered_df, min_c, max_c, county, radius)
+        fig = px.choropleth(
+            df_map,
+            geojson=counties_geojson,
+            locations="fips",
+            featureidkey="properties.GEOID",
+            color="cluster",
+            scope="usa",
+            category_orders={ "cluster": sorted(df_map["cluster"].unique()) },
+            color_discrete_sequence = px.colors.qualitative.Plotly,
+            title="Counties by Resilience Clusters",
+            hover_data=hover_columns + ["cluster", "fips_int"],
+        )
+        fig.update_traces(marker_line_width=0.5)
+
+    # If the map toggle is Community Resilience Index (CRI)
+    else:
+        df_map = filter_map(cri_df, min_c, max_c, county, radius)
+        fig = px.choropleth(
+            df_map,
+            geojson=counties_geojson,
+            locations="fips",
+            featureidkey="properties.GEOID",
+            color="Community Resilience Index (CRI)",
+            color_continuous_scale="Viridis",
+            scope="usa",
+            title="CRI by Georgia County",
+            hover_data=hover_columns + ["Community Resilience Index (CRI)", "fips_int"],
+        )
+
+    # Override the default hover template to include custom data
+    fig.update_traces(
+        hovertemplate=(
+            "<b>%{customdata[0]}</b><br>"
+            "Socioeconomic: %{customdata[1]:.4f}<br>"
+            "Food: %{customdata[2]:.4f}<br>"
+            "Healthcare: %{customdata[3]:.4f}<br>"
+            "CRI: %{customdata[4]:.4f}<extra></extra>"
+        )
+    )
+
+    # Update the map layout
+    fig.update_geos(
+        fitbounds="locations", visible=False,
+        lonaxis=dict(range=[-85.5, -80.5]),
+        lataxis=dict(range=[30, 35.5])
+    )
+    fig.update_layout(margin={"t": 30, "b": 0, "l": 0, "r": 0}, title_x=0.3)
+    return fig
 
 #
 # ─── SIDEBAR : NEWS FEED + NOAA WARNINGS ───────────────────────────────────────────────────────────────────────
@@ -163,10 +380,10 @@ with st.sidebar:
     terms = [keyword.strip() + " Georgia" for keyword in keyword_input.split(",") if keyword.strip()]
     quote = urllib.parse.quote_plus(" OR ".join(terms))
     feed_urls = f"https://news.google.com/rss/search?q={quote}&hl=en-US&gl=US&ceid=US:en"
-    feed = feedparser.parse(feed_urls)
-
-
-    sidebar_entries = feed.entries[:articles]
+    try:
+        sidebar_entries = load_rss(feed_urls)[:articles]
+    except (requests.RequestException, ET.ParseError):
+        sidebar_entries = []
 
     # Pagination logic
     if "news_page" not in st.session_state or st.session_state.get("news_query") != feed_urls:
@@ -174,15 +391,15 @@ with st.sidebar:
         st.session_state.news_query = feed_urls
     curr_page = st.session_state.news_page
     per_page = 5
-    total_pages = math.ceil(len(sidebar_entries) / per_page) or 1
+    total_pages = max(1, (len(sidebar_entries) + per_page - 1) // per_page)
 
     # Just render the sidebar entries for the current page
     start = (curr_page - 1) * per_page
     end = start + per_page
     for entry in sidebar_entries[start:end]:
-        date = entry.get("published", "").split("T")[0]
+        date = entry["published"].split("T")[0]
         st.sidebar.markdown(
-            f"**[{entry.title}]({entry.link})**  \n*{date}*"
+            f"**[{entry['title']}]({entry['link']})**  \n*{date}*"
         )
     
     # Renders the page navigation buttons
@@ -217,15 +434,12 @@ with left:
     # CRI slider filter
     min_c, max_c = st.slider(
         "CRI range",
-        float(cri_df["Community Resilience Index (CRI)"].min()),
-        float(cri_df["Community Resilience Index (CRI)"].max()),
-        (
-          float(cri_df["Community Resilience Index (CRI)"].min()),
-          float(cri_df["Community Resilience Index (CRI)"].max()),
-        )
+        cri_min,
+        cri_max,
+        (cri_min, cri_max)
     )
     # County and radius filters
-    county = st.selectbox("County", ["All"]+sorted(cri_df["County Name"].unique()))
+    county = st.selectbox("County", ("All",) + county_options)
     radius = st.slider("Radius (mi)", 1, 100, 25)
 
     st.markdown("---")
@@ -253,121 +467,49 @@ with right:
     # and show the cluster centers
     if map_toggle == "Resilience Clusters":
         centers = pd.DataFrame(
-            kmeans_model.cluster_centers_,
+            cluster_centers,
             columns=[
                 "Socioeconomic Resilience",
                 "Food Resilience",
                 "Healthcare Resilience"
             ],
-            index=[f"Cluster {i}" for i in range(len(kmeans_model.cluster_centers_))]
+            index=[f"Cluster {i}" for i in range(len(cluster_centers))]
         ).round(4)
         st.subheader("Resilience Cluster Centers")
         st.table(centers)
         
-        base = clustered_df.copy()
+        base = clustered_df
         color_col = "cluster"
     else:
-        base = cri_df.copy()
+        base = cri_df
         color_col = "Community Resilience Index (CRI)"
 
 
     
     # Prepare the map DataFrame
     # Filter the base DataFrame based on the CRI range and county selection
-    df_map = base[(base["Community Resilience Index (CRI)"] >= min_c) & (base["Community Resilience Index (CRI)"] <= max_c)].copy()
-    if county!="All":
-        center = centroids[cri_df.loc[cri_df["County Name"]==county,"fips"].iloc[0]]
-        df_map["dist"] = df_map["fips"].map(lambda f: haversine(center, centroids[f]))
-        df_map = df_map[df_map["dist"] <= radius]
+    df_map = filter_map(base, min_c, max_c, county, radius)
 
     # Warning fip codes are received from the helper function calling the NOAA API
     warning_fips = fetch_noaa_warnings()
-    df_map["warning"] = df_map["fips"].isin(warning_fips)
-
-
-    # Build the choropleth map using Plotly Express
-
-    # If the map toggle is resilience cluster
-    if map_toggle == "Resilience Clusters":
-        fig = px.choropleth(
-            df_map,
-            geojson=counties_geojson,
-            locations="fips",
-            featureidkey="properties.GEOID",
-            color="cluster",
-            scope="usa",
-            category_orders={ "cluster": sorted(df_map["cluster"].unique()) },
-            color_discrete_sequence = px.colors.qualitative.Plotly,
-            title="Counties by Resilience Clusters",
-            hover_data=[
-                "County Name",
-                "Socioeconomic Resilience",
-                "Food Resilience",
-                "Healthcare Resilience",
-                "cluster"
-            ],
-        )
-        fig.update_traces(marker_line_width=0.5)
-
-    # If the map toggle is Community Resilience Index (CRI)
-    else:
-        fig = px.choropleth(
-            df_map,
-            geojson=counties_geojson,
-            locations="fips",
-            featureidkey="properties.GEOID",
-            color="Community Resilience Index (CRI)",
-            color_continuous_scale="Viridis",
-            scope="usa",
-            title="CRI by Georgia County",
-            hover_data=[
-                "County Name",
-                "Socioeconomic Resilience",
-                "Food Resilience",
-                "Healthcare Resilience",
-                "Community Resilience Index (CRI)",
-            ],
-        )
 
-    # Override the default hover template to include custom data
-    fig.update_traces(
-        hovertemplate=(
-            "<b>%{customdata[0]}</b><br>"
-            "Socioeconomic: %{customdata[1]:.4f}<br>"
-            "Food: %{customdata[2]:.4f}<br>"
-            "Healthcare: %{customdata[3]:.4f}<br>"
-            "CRI: %{customdata[4]:.4f}<extra></extra>"
-        )
-    )
+    # Build (or reuse) the choropleth map for the current filters
+    fig = build_fig(map_toggle, min_c, max_c, county, radius if county != "All" else None)
 
     # To make sure NOAA warnings are shown properly with coloring already going on for CRI and Resilience Clusters,
     # we need to set the border colors and widths based on the warning status
-    border_colors  = ["red" if w else "#444" for w in df_map["warning"]]
-    border_widths  = [3 if w else 1 for w in df_map["warning"]]
-    fig.update_traces(
-        marker_line_color=border_colors,
-        marker_line_width=border_widths
-    )
-
-
-    # Title alignment for the graph
-    fig.update_layout(title_x=0.3)
-
+    for trace in fig.data:
+        warning_mask = np.isin(np.asarray(trace.customdata)[:, -1].astype(np.int32), warning_fips)
+        trace.marker.line.color = np.where(warning_mask, "red", "#444")
+        trace.marker.line.width = np.where(warning_mask, 3, 1)
 
     # Show the active NOAA warnings in the sidebar with the FIPS codes
-    codes = sorted(warning_fips)
+    codes = warning_fips.tolist()
     if codes:
         st.sidebar.write("Active alert FIPS codes:", codes)
     else:
         st.sidebar.info("No active NOAA alerts for Georgia right now.")
 
-    # Update the map layout
-    fig.update_geos(
-        fitbounds="locations", visible=False,
-        lonaxis=dict(range=[-85.5, -80.5]),
-        lataxis=dict(range=[30, 35.5])
-    )
-    fig.update_layout(margin={"t": 30, "b": 0, "l": 0, "r": 0}, title_x=0.3)
     st.plotly_chart(fig, use_container_width=True)
 
     # Bar chart + Details
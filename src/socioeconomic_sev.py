@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 
 # --------------------
@@ -16,34 +17,35 @@ import pandas as pd
 # Input:
 #   data/socioeconomic_full.csv
 # Output:
-#   data/socioeconomic_sev.csv
+#   data/socioeconomic_sev.parquet
 
 # 1) Load enriched socioeconomic data
 input_path = 'data/socioeconomic_full.csv'
 if not os.path.exists(input_path):
     raise FileNotFoundError(f"Missing input file: {input_path}")
 
-df = pd.read_csv(input_path)
+# FIPS stay strings so the Parquet output keeps their leading zeros
+df = pd.read_csv(input_path, dtype={'State': str, 'county': str})
 
-# 2) Normalize indicators via min-max to [0,1]
+# 2) Normalize indicators via min-max to [0,1] in one NumPy pass over an (n, 3) array (NaN-aware, like the pandas reductions)
 metrics = ['Poverty Rate', 'No_HS_Education', 'Housing_Cost_Burden']
-for metric in metrics:
-    minimum = df[metric].min()
-    maximum = df[metric].max()
-    # Avoid division by zero if all values are equal
-    if maximum > minimum:
-        df[f'norm_{metric}'] = (df[metric] - minimum) / (maximum - minimum)
-    else:
-        df[f'norm_{metric}'] = 0.0
+values = df[metrics].to_numpy(dtype=float)
+minimum = np.nanmin(values, axis=0)
+maximum = np.nanmax(values, axis=0)
+# Avoid division by zero if all values are equal (those columns normalize to 0.0)
+spread = np.where(maximum > minimum, maximum - minimum, 1.0)
+normalized = np.where(maximum > minimum, (values - minimum) / spread, 0.0)
+# The norm_* columns are kept so the output schema doesn't change
+df[[f'norm_{metric}' for metric in metrics]] = normalized
 
 # 3) Compute Socioeconomic Vulnerability Score (SEV) as the average of normalized metrics
-df['SEV'] = df[[f'norm_{metric}' for metric in metrics]].mean(axis=1)
+df['SEV'] = np.nanmean(normalized, axis=1)
 
 # 4) 1 - SEV = Resiliency Score
 df['Resilience_Socio'] = 1 - df['SEV']
 
-# 5) Save the results
+# 5) Save the results as Parquet (columnar, typed, and much faster to load than re-parsing a CSV)
 os.makedirs('data', exist_ok=True)
-output_path = 'data/socioeconomic_sev.csv'
-df.to_csv(output_path, index=False)
+output_path = 'data/socioeconomic_sev.parquet'
+df.to_parquet(output_path, index=False, compression='zstd')
 print(f"Saved socioeconomic SEV data to {output_path}")
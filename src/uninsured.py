@@ -2,6 +2,7 @@
 
 import os
 import requests
+import numpy as np
 import pandas as pd
 
 # --------------------
@@ -34,22 +35,21 @@ resp = requests.get(BASE_URL, params=params)
 resp.raise_for_status()
 data = resp.json()
 
-# 4) Parse into DataFrame
-columns = data[0]
-rows = data[1:]
-df = pd.DataFrame(rows, columns=columns)
+# 4) Parse straight into a typed DataFrame: transpose the rows into columns once,
+#    and cast the two counts to int32 as each column is built (no intermediate all-string frame)
+header = data[0]
+columns = dict(zip(header, zip(*data[1:])))
 
-# 5) Convert to numeric
-df['total_under65'] = df[VARS['total_under65']].astype(int)
-df['uninsured_count'] = df[VARS['uninsured_under65']].astype(int)
-df['county_name'] = df['NAME']
-df['state'] = df['state']
-df['county'] = df['county']
-
-# 6) Select & reorder columns
-out = df[['state', 'county', 'county_name', 'uninsured_count', 'total_under65']]
+# 5) Select & reorder columns
+out = pd.DataFrame({
+    'state': columns['state'],
+    'county': columns['county'],
+    'county_name': columns['NAME'],
+    'uninsured_count': np.array(columns[VARS['uninsured_under65']], dtype=np.int32),
+    'total_under65': np.array(columns[VARS['total_under65']], dtype=np.int32),
+})
 
-# 7) Save to CSV
+# 6) Save to CSV
 os.makedirs('data', exist_ok=True)
 output_path = 'data/healthcare_uninsured_counts.csv'
 
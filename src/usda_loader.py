@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 # --------------------
@@ -11,26 +12,36 @@ import pandas as pd
 #   - data/socioeconomic_full.csv --> counties with poverty, education, and housing metrics.
 #   - data/2019 Food Access Research Atlas Data/Food Access Research Atlas.csv --> tract-level LILA flags and low-access percentages.
 # Output:
-#   data/food_access_score.csv
+#   data/food_access_score.parquet
 
-# load and pads the FIPS with zeros
-census = pd.read_csv('data/socioeconomic_full.csv', dtype=str)
+# load and pads the FIPS with zeros (only the FIPS are read as strings, so the metrics stay numeric in the Parquet output)
+census = pd.read_csv('data/socioeconomic_full.csv', dtype={'State': str, 'county': str})
 census['county'] = census['county'].str.zfill(3)
 
-atlas = pd.read_csv('data/2019 Food Access Research Atlas Data/Food Access Research Atlasp.csv', dtype=str, low_memory=False)
+# only the two columns used below are parsed out of the (very wide) atlas
+atlas = pd.read_csv(
+    'data/2019 Food Access Research Atlas Data/Food Access Research Atlas.csv',
+    usecols=['CensusTract', 'LILATracts_1And10'],
+    dtype={'CensusTract': str},
+)
 # extract FIPS
 atlas['State']  = atlas['CensusTract'].str[:2]
 atlas['county'] = atlas['CensusTract'].str[2:5]
 atlas = atlas[atlas['State']=='13']  # Georgia only
 # casts LILA (Low Income, Low Access)
-atlas['LILATracts_1And10'] = atlas['LILATracts_1And10'].astype(int)
+lila = atlas['LILATracts_1And10'].to_numpy(dtype=np.int8)
 
 # Calculates the fraction of LILA tracts that are flagged
-county_flag = (
-    atlas.groupby(['State','county'])
-         .agg(frac_lila_tracts=('LILATracts_1And10','mean'))
-         .reset_index()
-)
+# State is always '13' here, so the 3-digit county code indexes a bincount directly (sum and count per county)
+county_codes = atlas['county'].to_numpy().astype(np.int16)
+lila_sums = np.bincount(county_codes, weights=lila)
+tract_counts = np.bincount(county_codes)
+has_tracts = np.flatnonzero(tract_counts)
+county_flag = pd.DataFrame({
+    'State': '13',
+    'county': pd.Series(has_tracts).astype(str).str.zfill(3),
+    'frac_lila_tracts': lila_sums[has_tracts] / tract_counts[has_tracts],
+})
 
 # Merges with the socioeconomic_full.csv file we made earlier
 merged = census.merge(county_flag, on=['State','county'], how='left')
@@ -39,5 +50,5 @@ merged = census.merge(county_flag, on=['State','county'], how='left')
 merged = merged.rename(columns={'frac_lila_tracts':'FIS'})
 merged['Resilience_Food'] = 1 - merged['FIS']
 
-merged.to_csv('data/food_access_score.csv', index=False)
-print("✅ food_access_score.csv written")
+merged.to_parquet('data/food_access_score.parquet', index=False, compression='zstd')
+print("✅ food_access_score.parquet written")